@@ -10,8 +10,10 @@ https://docs.python.org/3/library/datetime.html
 
 import csv
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, TypedDict
+from operator import itemgetter
+from typing import List, Dict, Tuple, Set
 
 import ui_handler as UI
 
@@ -29,55 +31,145 @@ CHARACTER_FILE = 'data/characters.csv'
 PROGRESS_FILE = 'data/user_progress.csv'
 MISTAKES_FILE = 'data/mistakes.csv'
 
+# Parsed vocab for each JLPT level, stored with the file's mtime when it was read.
+_VOCAB_CACHE: Dict[str, Tuple[float, List[Dict[str, str]]]] = {}
 
-class Mistake(TypedDict):
-    word: str
-    kana: str
-    correct_answer: str
-    user_answer: str
-    mistake_count: int
-    last_mistake_date: str
+# JLPT levels whose file could not be found, so the error is only reported once.
+_MISSING_LEVELS: Set[str] = set()
+
+# Parsed characters, reused until the characters file changes on disk.
+_CHARACTER_CACHE = {'mtime': None, 'data': None}
+
+# Answer strings for each loaded list, stored with the list they were built from.
+_ANSWER_POOL_CACHE: Dict[str, Tuple[List[Dict[str, str]], Tuple[str, ...]]] = {}
 
 
 def load_jlpt_vocab(level: str) -> List[Dict[str, str]]:
     """
     Load vocabulary from specified JLPT level file.
+    The file is only parsed again if it has changed since the last call.
     
     Args:
         level (str): JLPT level as a string.
 
     Returns:
         list[dict[str, str]]: A list of dictionaries containing specified JLPT level's vocab data. Returns an empty list if level does not exist.
+        The list is shared between callers and must not be modified.
     """
-    vocab_list = []
-
     if level not in JLPT_FILES:
         return []
     
     try:
-        with open(JLPT_FILES[level], 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for vocab in reader:
-                vocab_list.append(vocab)
+        mtime = os.stat(JLPT_FILES[level]).st_mtime
+
+        if level in _VOCAB_CACHE and _VOCAB_CACHE[level][0] == mtime:
+            return _VOCAB_CACHE[level][1]
+
+        with open(JLPT_FILES[level], 'r', newline='', encoding='utf-8') as f:
+            vocab_list = list(csv.DictReader(f))
+
+        _VOCAB_CACHE[level] = (mtime, vocab_list)
+        _MISSING_LEVELS.discard(level)
         return vocab_list
     except FileNotFoundError:
-        print(f'Task failed. {UI.Colours.YELLOW}jlpt_{level.lower()}.csv{UI.Colours.END} cannot be found.')
+        if level not in _MISSING_LEVELS:
+            _MISSING_LEVELS.add(level)
+            print(f'Task failed. {UI.Colours.YELLOW}jlpt_{level.lower()}.csv{UI.Colours.END} cannot be found.')
+
+
+def load_all_jlpt_vocab() -> Dict[str, List[Dict[str, str]]]:
+    """
+    Load vocabulary from every JLPT level file.
+    Levels that have not been attempted yet are read in parallel, since each file is independent.
+
+    Returns:
+        dict[str, list[dict[str, str]]]: A dictionary mapping each JLPT level to its vocab data (see load_jlpt_vocab).
+    """
+    levels = list(JLPT_FILES)
+
+    if any(level not in _VOCAB_CACHE and level not in _MISSING_LEVELS for level in levels):
+        with ThreadPoolExecutor(max_workers=len(levels)) as executor:
+            return dict(zip(levels, executor.map(load_jlpt_vocab, levels)))
+
+    return {level: load_jlpt_vocab(level) for level in levels}
 
     
 def load_characters() -> List[Dict[str, str]]:
     """
     Load japanese characters from the characters file.
+    The file is only parsed again if it has changed since the last call.
 
     Returns:
         list[dict[str, str]]: A list of dictionaries containing Japanese characters.
+        The list is shared between callers and must not be modified.
     """
-    character_list = []
-
     try:
-        with open(CHARACTER_FILE, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for character in reader:
-                character_list.append(character)
+        mtime = os.stat(CHARACTER_FILE).st_mtime
+
+        if _CHARACTER_CACHE['data'] is not None and _CHARACTER_CACHE['mtime'] == mtime:
+            return _CHARACTER_CACHE['data']
+
+        with open(CHARACTER_FILE, 'r', newline='', encoding='utf-8') as f:
+            character_list = list(csv.DictReader(f))
+
+        _CHARACTER_CACHE['mtime'] = mtime
+        _CHARACTER_CACHE['data'] = character_list
         return character_list
     except FileNotFoundError:
         print(f'Task failed. {UI.Colours.YELLOW}{CHARACTER_FILE}{UI.Colours.END} cannot be found.')
+
+
+def build_answer_pool(key: str, content: List[Dict[str, str]], field: str) -> Tuple[str, ...]:
+    """
+    Builds a tuple holding only the answer field of each vocab / character.
+    The tuple is reused until the source list is reloaded.
+
+    Args:
+        key (str): Name to cache the pool under.
+        content (list[dict[str, str]]): A list of dictionaries containing vocabs / characters.
+        field (str): The key of the answer field (e.g. 'Meaning').
+
+    Returns:
+        tuple[str, ...]: The answer of every item in the list.
+    """
+    cached = _ANSWER_POOL_CACHE.get(key)
+
+    if cached is None or cached[0] is not content:
+        cached = (content, tuple(map(itemgetter(field), content)))
+        _ANSWER_POOL_CACHE[key] = cached
+
+    return cached[1]
+
+
+def load_meaning_pool(level: str) -> Tuple[str, ...]:
+    """
+    Load the meanings of every vocab in the specified JLPT level.
+
+    Args:
+        level (str): JLPT level as a string.
+
+    Returns:
+        tuple[str, ...]: The meaning of every vocab in the level.
+    """
+    return build_answer_pool(level, load_jlpt_vocab(level) or [], 'Meaning')
+
+
+def load_character_pool() -> Tuple[str, ...]:
+    """
+    Load the readings of every Japanese character.
+
+    Returns:
+        tuple[str, ...]: The reading of every character.
+    """
+    return build_answer_pool('characters', load_characters() or [], 'Correct Answer')
+
+
+def preload():
+    """
+    Loads every JLPT level, the characters and their answer pools into the caches,
+    so no file needs to be parsed while the user is in a menu or quiz.
+    The JLPT Quiz menu's vocab totals are read from the same cache.
+    """
+    for level in load_all_jlpt_vocab():
+        load_meaning_pool(level)
+    load_character_pool()
@@ -8,14 +8,24 @@ https://docs.python.org/3/library/csv.html
 
 
 import csv
+import os
+import time
 from datetime import datetime
-from typing import List, Dict, TypedDict
+from typing import List, Dict, Tuple, TypedDict
 
 import ui_handler as UI
 import data_loader as DATA
 
 
 MISTAKE_FILE = 'data/mistakes.csv'
+MISTAKE_FIELDS = ['word', 'kana', 'correct_answer', 'user_answer', 'mistake_count', 'last_mistake_date']
+
+# Parsed mistakes keyed by (word, kana), reused until the mistakes file changes on disk.
+# While 'dirty' is set, the cache holds changes that have not been flushed to the file yet.
+_MISTAKES_CACHE = {'mtime': None, 'data': None, 'dirty': False}
+
+# The last formatted timestamp and the second it was formatted for.
+_TIMESTAMP_CACHE = {'second': None, 'value': ''}
 
 
 class Mistake(TypedDict):
@@ -27,11 +37,48 @@ class Mistake(TypedDict):
         kana: The Kana pronunciation of the word
         correct_answer: The correct meaning that should have been chosen
         user_answer: The incorrect option that the user actually chose
+        mistake_count: The number of times this word has been answered incorrectly
+        last_mistake_date: When the word was last answered incorrectly ('yy-mm-dd HH:MM:SS')
     """
     word: str
     kana: str
     correct_answer: str
     user_answer: str
+    mistake_count: int
+    last_mistake_date: str
+
+
+def load_mistake_index() -> Dict[Tuple[str, str], Mistake]:
+    """
+    Loads the saved mistakes keyed by their (word, kana) pair.
+
+    Raises:
+        FileNotFoundError: If the mistakes file does not exist.
+
+    Returns:
+        dict[tuple[str, str], Mistake]: A dictionary mapping (word, kana) to the saved mistake, in file order.
+    """
+    # Unflushed changes are newer than anything on disk.
+    if _MISTAKES_CACHE['dirty']:
+        return _MISTAKES_CACHE['data']
+
+    mtime = os.stat(MISTAKE_FILE).st_mtime
+
+    # Reuse the parsed mistakes if the file has not changed since it was last read.
+    if _MISTAKES_CACHE['data'] is not None and _MISTAKES_CACHE['mtime'] == mtime:
+        return _MISTAKES_CACHE['data']
+
+    mistake_index = {}
+
+    with open(MISTAKE_FILE, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for mistake in reader:
+            mistake['mistake_count'] = int(mistake['mistake_count'])
+            mistake_index[(mistake['word'], mistake['kana'])] = mistake
+
+    _MISTAKES_CACHE['mtime'] = mtime
+    _MISTAKES_CACHE['data'] = mistake_index
+    return mistake_index
 
 
 def load_mistakes() -> List[Mistake]:
@@ -47,33 +94,74 @@ def load_mistakes() -> List[Mistake]:
         - mistake_count (int)
         - last_mistake_date (str)
     """
-    user_mistakes = []
-
     try:
-        with open(MISTAKE_FILE, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for mistake in reader:
-                mistake['mistake_count'] = int(mistake['mistake_count'])
-                user_mistakes.append(mistake)
-        return user_mistakes
+        return list(load_mistake_index().values())
     except FileNotFoundError:
         # TODO Create default progress file if can't find file.
         print(f'Task failed. {UI.Colours.YELLOW}{MISTAKE_FILE}{UI.Colours.END} cannot be found.')
 
 
+def save_mistakes(mistake_index: Dict[Tuple[str, str], Mistake]):
+    """
+    Writes the given mistakes to the mistakes file and refreshes the cache.
+
+    Args:
+        mistake_index (dict[tuple[str, str], Mistake]): All mistakes to save, keyed by (word, kana).
+    """
+    # Write to a temporary file first so an interrupted write never leaves a half-written file behind.
+    with open(MISTAKE_FILE + '.tmp', 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(MISTAKE_FIELDS)
+        writer.writerows([[mistake[field] for field in MISTAKE_FIELDS] for mistake in mistake_index.values()])
+    os.replace(MISTAKE_FILE + '.tmp', MISTAKE_FILE)
+
+    _MISTAKES_CACHE['mtime'] = os.stat(MISTAKE_FILE).st_mtime
+    _MISTAKES_CACHE['data'] = mistake_index
+    _MISTAKES_CACHE['dirty'] = False
+
+
+def flush_mistakes():
+    """
+    Writes any mistakes added since the last flush to the mistakes file.
+    """
+    if _MISTAKES_CACHE['dirty']:
+        save_mistakes(_MISTAKES_CACHE['data'])
+
+
+def get_timestamp() -> str:
+    """
+    Gets the current time in the format used for last_mistake_date.
+    The formatted string is reused for calls within the same second.
+
+    Returns:
+        str: The current time formatted as 'yy-mm-dd HH:MM:SS'.
+    """
+    second = int(time.time())
+
+    if _TIMESTAMP_CACHE['second'] != second:
+        _TIMESTAMP_CACHE['second'] = second
+        _TIMESTAMP_CACHE['value'] = datetime.fromtimestamp(second).strftime('%y-%m-%d %H:%M:%S')
+
+    return _TIMESTAMP_CACHE['value']
+
+
 def get_mistake_count() -> int:
     """
     Gets the total count of mistakes.
 
     Returns:
-        int: Integer value of the total number of user mistakes.
+        int: Integer value of the total number of user mistakes. Returns 0 if the mistakes file cannot be found.
     """
-    return len(load_mistakes())
+    try:
+        return len(load_mistake_index())
+    except FileNotFoundError:
+        return 0
 
 
 def add_mistake(word: str, kana: str, correct_answer: str, user_answer: str):
     """
-    Adds a mistake in the mistakes file. If it already exists, increment mistake count by 1.
+    Adds a mistake to the mistake data bank. If it already exists, increment mistake count by 1.
+    The change is kept in memory until flush_mistakes() is called.
 
     Args:
         word (str): Japanese word
@@ -81,35 +169,33 @@ def add_mistake(word: str, kana: str, correct_answer: str, user_answer: str):
         correct_answer (str): The correct answer
         user_answer (str): User's incorrect answer
     """
-    user_mistakes = load_mistakes()
+    try:
+        mistake_index = load_mistake_index()
+    except FileNotFoundError:
+        mistake_index = {}
 
-    mistake_updated = False
+    mistake = mistake_index.get((word, kana))
 
-    for mistake in user_mistakes:
-        # If mistake already exists in the data bank, increment its count.
-        if mistake['word'] == word and mistake['kana'] == kana:
-            mistake['correct_answer'] = correct_answer
-            mistake['user_answer'] = user_answer
-            mistake['mistake_count'] += 1
-            mistake['last_mistake_date'] = datetime.now().strftime('%y-%m-%d %H:%M:%S')
-            mistake_updated = True
-            break
+    # If mistake already exists in the data bank, increment its count.
+    if mistake:
+        mistake['correct_answer'] = correct_answer
+        mistake['user_answer'] = user_answer
+        mistake['mistake_count'] += 1
+        mistake['last_mistake_date'] = get_timestamp()
 
     # If mistake does not exist in the data bank, add it.
-    if not mistake_updated:
-        user_mistakes.append({
+    else:
+        mistake_index[(word, kana)] = {
             'word': word,
             'kana': kana,
             'correct_answer': correct_answer,
             'user_answer': user_answer,
             'mistake_count': 1,
-            'last_mistake_date': datetime.now().strftime('%y-%m-%d %H:%M:%S')
-        })
+            'last_mistake_date': get_timestamp()
+        }
 
-    with open(MISTAKE_FILE, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['word', 'kana', 'correct_answer', 'user_answer', 'mistake_count', 'last_mistake_date'])
-        writer.writeheader()
-        writer.writerows(user_mistakes)
+    _MISTAKES_CACHE['data'] = mistake_index
+    _MISTAKES_CACHE['dirty'] = True
 
 
 def remove_mistake(word: str) -> bool:
@@ -122,22 +208,46 @@ def remove_mistake(word: str) -> bool:
     Returns:
         Boolean: True if mistake has been removed successfully. False otherwise.
     """
-    user_mistakes = load_mistakes()
-    old_mistake_count = len(user_mistakes)
+    mistake_index = load_mistake_index()
 
     # Remove the mistake from the list.
-    filtered_mistakes = []
-    for mistake in user_mistakes:
+    filtered_mistakes = {}
+    for key, mistake in mistake_index.items():
         if mistake['word'] != word:
-            filtered_mistakes.append(mistake)
+            filtered_mistakes[key] = mistake
+
+    # Nothing was removed, so the saved file is already up to date.
+    if len(filtered_mistakes) == len(mistake_index):
+        return False
 
     # Write and save the new mistake list
-    with open(MISTAKE_FILE, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['word', 'kana', 'correct_answer', 'user_answer', 'mistake_count', 'last_mistake_date'])
-        writer.writeheader()
-        writer.writerows(filtered_mistakes)
+    save_mistakes(filtered_mistakes)
+
+    return True
+
+
+def replace_mistakes(mistakes: List[Dict[str, str]]):
+    """
+    Replaces all saved mistakes with the given ones in a single write, so the
+    mistakes file is never left empty in between. Each mistake starts again with a count of 1.
+
+    Args:
+        mistakes (list[dict[str, str]]): The mistakes to keep, each with word, kana, correct_answer and user_answer.
+    """
+    timestamp = get_timestamp()
+    mistake_index = {}
+
+    for mistake in mistakes:
+        mistake_index[(mistake['word'], mistake['kana'])] = {
+            'word': mistake['word'],
+            'kana': mistake['kana'],
+            'correct_answer': mistake['correct_answer'],
+            'user_answer': mistake['user_answer'],
+            'mistake_count': 1,
+            'last_mistake_date': timestamp
+        }
 
-    return len(user_mistakes) < old_mistake_count
+    save_mistakes(mistake_index)
 
 
 def reset_mistakes() -> bool:
@@ -148,11 +258,7 @@ def reset_mistakes() -> bool:
         True if reset successfully. False otherwise.
     """
     try:
-        with open(MISTAKE_FILE, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['word', 'kana', 'correct_answer', 'user_answer', 'mistake_count', 'last_mistake_date'])
-        
-        mistake_count = len(load_mistakes())
+        save_mistakes({})
         return True
     
     except Exception as e:
@@ -16,18 +16,39 @@ import ui_handler as UI
 import data_loader as DATA
 
 PROGRESS_FILE = 'data/user_progress.csv'
+PROGRESS_DIR = os.path.dirname(PROGRESS_FILE)
 
+# Parsed mastery sets, reused until the progress file changes on disk.
+# While 'dirty' is set, the cache holds changes that have not been flushed to the file yet.
+_MASTERY_CACHE = {'mtime': None, 'data': None, 'dirty': False}
 
-def create_progress_file():
+
+def save_progress(mastery: Dict[str, Set[str]]):
     """
-    Creates an empty progress file.
+    Writes the given mastery sets to the progress file and refreshes the cache.
+    The rows go to a temporary file that then replaces the progress file.
+
+    Args:
+        mastery (dict[str, set[str]]): The mastered vocab kanji for each JLPT level.
     """
-    os.makedirs(os.path.dirname(PROGRESS_FILE), exist_ok=True)
-    with open(PROGRESS_FILE, 'w', newline='', encoding='utf-8') as f:
+    with open(PROGRESS_FILE + '.tmp', 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
         writer.writerow(['level', 'mastered_vocab'])
-        for level in ['N5', 'N4', 'N3', 'N2', 'N1']:
-            writer.writerow([level])
+        writer.writerows([[level, *vocabs] for level, vocabs in mastery.items()])
+    os.replace(PROGRESS_FILE + '.tmp', PROGRESS_FILE)
+
+    _MASTERY_CACHE['mtime'] = os.stat(PROGRESS_FILE).st_mtime
+    _MASTERY_CACHE['data'] = mastery
+    _MASTERY_CACHE['dirty'] = False
+
+
+def create_progress_file():
+    """
+    Creates an empty progress file.
+    """
+    if not os.path.isdir(PROGRESS_DIR):
+        os.makedirs(PROGRESS_DIR, exist_ok=True)
+    save_progress({level: set() for level in DATA.JLPT_FILES})
 
 
 def load_mastered_vocabs() -> Dict[str, Set[str]]:
@@ -37,25 +58,33 @@ def load_mastered_vocabs() -> Dict[str, Set[str]]:
     Returns:
         Dict mapping JLPT levels to sets of mastered vocabulary kanji
     """
-    mastery = {
-        'N5': set(),
-        'N4': set(),
-        'N3': set(),
-        'N2': set(),
-        'N1': set()
-    }
+    mastery = {level: set() for level in DATA.JLPT_FILES}
+
+    # Unflushed changes are newer than anything on disk.
+    if _MASTERY_CACHE['dirty']:
+        return _MASTERY_CACHE['data']
 
     try:
-        with open(PROGRESS_FILE, 'r', encoding='utf-8') as f:
+        mtime = os.stat(PROGRESS_FILE).st_mtime
+
+        # Reuse the parsed sets if the file has not changed since it was last read.
+        if _MASTERY_CACHE['data'] is not None and _MASTERY_CACHE['mtime'] == mtime:
+            return _MASTERY_CACHE['data']
+
+        # The csv module undoes the quoting the writer adds to kanji containing ',' or '"'.
+        with open(PROGRESS_FILE, 'r', newline='', encoding='utf-8') as f:
             reader = csv.reader(f)
-            next(reader)
-            for line in reader:
-                if len(line) >= 2:
-                    level = line[0]
-                    vocabs = line[1:]
-                    for vocab in vocabs:
-                        if vocab.strip():
-                            mastery[level].add(vocab)
+            next(reader, None)
+
+            for row in reader:
+                if not row:
+                    continue
+                level, *vocabs = row
+                if vocabs:
+                    mastery[level].update(vocab for vocab in vocabs if vocab.strip())
+
+        _MASTERY_CACHE['mtime'] = mtime
+        _MASTERY_CACHE['data'] = mastery
         return mastery
     except FileNotFoundError:
         create_progress_file()
@@ -65,6 +94,7 @@ def load_mastered_vocabs() -> Dict[str, Set[str]]:
 def add_mastered_vocab(level: str, kanji: str) -> bool:
     """
     Add a vocab to the user's mastered list.
+    The change is kept in memory until flush_progress() is called.
 
     Args:
         level (str): JLPT level
@@ -80,16 +110,20 @@ def add_mastered_vocab(level: str, kanji: str) -> bool:
     
     mastery[level].add(kanji)
 
-    with open(PROGRESS_FILE, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(['level', 'mastered_vocab'])
-        for level, vocab_set in mastery.items():
-            row = [level] + list(vocab_set)
-            writer.writerow(row)
+    _MASTERY_CACHE['data'] = mastery
+    _MASTERY_CACHE['dirty'] = True
     
     return True
 
 
+def flush_progress():
+    """
+    Writes any vocabs mastered since the last flush to the progress file.
+    """
+    if _MASTERY_CACHE['dirty']:
+        save_progress(_MASTERY_CACHE['data'])
+
+
 def load_user_progress() -> Dict[str, tuple[int, int]]:
     """
     Loads user progress saved from the user_progress file.
@@ -102,9 +136,7 @@ def load_user_progress() -> Dict[str, tuple[int, int]]:
 
     for level in mastery:
         mastered = len(mastery[level])
-
-        all_vocab = DATA.load_jlpt_vocab(level)
-        total = len(all_vocab)
+        total = len(DATA.load_jlpt_vocab(level) or [])
 
         user_progress[level] = (mastered, total)
     
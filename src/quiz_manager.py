@@ -9,13 +9,13 @@ https://docs.python.org/3/library/functions.html#ord
 
 
 import random
-from typing import List, Dict, TypedDict, Tuple
+from itertools import chain
+from typing import List, Dict, TypedDict, Tuple, Sequence
 
 import ui_handler as UI
 import data_loader as DATA
 import progress_manager as PROGRESS
 import mistake_tracker as MISTAKE
-import quiz_manager as QUIZ
 
 
 class MistakeReview(TypedDict):
@@ -36,22 +36,135 @@ class MistakeReview(TypedDict):
     user_answer: str
 
 
-def generate_question(correct_content: Dict[str, str], all_content: List[Dict[str, str]], quiz_type: str) -> Tuple[str, List[str]]:
+def pick_distractors(pool: Sequence[str], correct_answer: str, count: int = 3) -> List[str]:
+    """
+    Picks random wrong answers to use as distractors without scanning the whole pool.
+
+    Args:
+        pool (Sequence[str]): The answers of all vocabs / characters.
+        correct_answer (str): The correct answer, which must not be picked.
+        count (int): The number of distractors to pick.
+
+    Returns:
+        list[str]: Up to `count` unique wrong answers in random order.
+    """
+    distractors = []
+
+    # Draw one extra candidate in case the correct answer is among the picks
+    for option in random.sample(pool, min(len(pool), count + 1)):
+        if option != correct_answer and option not in distractors:
+            distractors.append(option)
+            if len(distractors) == count:
+                return distractors
+
+    # Some picks shared the same answer, so fall back to every remaining option
+    remaining = list(dict.fromkeys(option for option in pool
+                                   if option != correct_answer and option not in distractors))
+    distractors.extend(random.sample(remaining, min(count - len(distractors), len(remaining))))
+
+    return distractors
+
+
+def build_options(correct_answer: str, pool: Sequence[str]) -> Tuple[List[str], int]:
+    """
+    Builds the options for a question by placing the correct answer at a random position among three distractors.
+
+    Args:
+        correct_answer (str): The correct answer.
+        pool (Sequence[str]): The answers of all vocabs / characters to draw distractors from.
+
+    Returns:
+        tuple[list[str], int]: A tuple with the list of options and the index of the correct answer in it.
+    """
+    # The distractors are already in random order, so inserting the correct answer
+    # at a random position gives a uniformly shuffled list without searching for it afterwards.
+    options = pick_distractors(pool, correct_answer)
+    correct_index = random.randint(0, len(options))
+    options.insert(correct_index, correct_answer)
+
+    return options, correct_index
+
+
+def format_question(heading: str, question_prompt: str, options: List[str], prompt_suffix: str = '') -> str:
+    """
+    Formats a question and its options as one block of text, so it can be printed in a single call.
+
+    Args:
+        heading (str): The question number and instruction.
+        question_prompt (str): The vocab / character being asked about.
+        options (list[str]): The answer options, labelled A, B, C, ... in order.
+        prompt_suffix (str): Uncoloured text to show after the prompt (e.g. the Kana).
+
+    Returns:
+        str: The formatted question, ending with the newline after the last option.
+    """
+    option_lines = ''.join(f'{UI.Colours.BOLD}{chr(65 + n)}{UI.Colours.END} | {option}\n' for n, option in enumerate(options))
+    return (f'{UI.Colours.BOLD}{heading}{UI.Colours.END}\n'
+            f'{UI.Colours.BOLD}{UI.Colours.PURPLE}{question_prompt}{UI.Colours.END}{prompt_suffix}\n'
+            f'{option_lines}')
+
+
+def ask_question(heading: str, question_prompt: str, options: List[str], correct_index: int,
+                 continue_msg: str, prompt_suffix: str = '') -> Tuple[str, int]:
+    """
+    Shows a question, gets the user's answer and handles quitting with confirmation.
+
+    Args:
+        heading (str): The question number and instruction.
+        question_prompt (str): The vocab / character being asked about.
+        options (list[str]): The answer options.
+        correct_index (int): The index of the correct answer in options.
+        continue_msg (str): The message to show if the user cancels quitting.
+        prompt_suffix (str): Uncoloured text to show after the prompt (e.g. the Kana).
+
+    Returns:
+        tuple[str, int]: A tuple of the outcome and the index of the chosen option (-1 if none was chosen).
+        The outcome is one of:
+        - 'correct': The user chose the correct answer
+        - 'wrong': The user chose a wrong answer
+        - 'quit': The user confirmed quitting
+        - 'continue': The user cancelled quitting, so the question should be asked again
+    """
+    # Print out the question and its options
+    print(format_question(heading, question_prompt, options, prompt_suffix))
+
+    # Getting the user's choice. Small levels may have fewer than four options.
+    user_choice = UI.get_user_choice('Answer | ', [chr(65 + n) for n in range(len(options))] + ['Q'])
+
+    # The user chooses to quit
+    if user_choice == 'Q':
+        # Confirmation
+        user_confirmation = UI.get_user_choice(UI.QUIT_CONFIRM_PROMPT, ['Y', 'N'])
+        # Confirmed
+        if user_confirmation == 'Y':
+            return 'quit', -1
+        # Cancelled
+        print(continue_msg, end='\n\n')
+        return 'continue', -1
+
+    # Getting the index of the chosen option
+    choice_index = ord(user_choice) - ord('A')
+
+    if choice_index == correct_index:
+        return 'correct', choice_index
+    return 'wrong', choice_index
+
+
+def generate_question(correct_content: Dict[str, str], quiz_type: str, pool: Sequence[str]) -> Tuple[str, List[str], int]:
     """
     Generates a question based on the type. Options will include the correct answer and three other randomized wrong answers.
 
     Args:
         correct_item (dict[str, str]): A dictionary containing the correct vocab / character.
-        all_content (list[dict[str, str]]): A list of dictionaries containing all vocabs / characters.
         quiz_type (str): A string representing the type of quiz to be displayed.
+        pool (Sequence[str]): The answers of all vocabs / characters to draw distractors from.
 
     Returns:
-        tuple[str, list[str]]: A tuple with the question and a list of four answers (including one right and three wrong ones).
+        tuple[str, list[str], int]: A tuple with the question, a list of four answers (including one right and three wrong ones)
+        and the index of the correct answer.
     """
-    options = []
     correct_answer = ''
     question_prompt = ''
-    option_type = ''
 
     # Display question in a format fitting for JLPT Quizzes
     if quiz_type == 'jlpt':
@@ -59,53 +172,24 @@ def generate_question(correct_content: Dict[str, str], all_content: List[Dict[st
         kanji = correct_content['Kanji']
         question_prompt = f"{kana} ({kanji})"
         correct_answer = correct_content['Meaning']
-        option_type = 'Meaning'
     
     # Display question in a format fitting for Character Quizzes
     elif quiz_type == 'character':
         question_prompt = correct_content ['Character']
         correct_answer = correct_content['Correct Answer']
-        option_type = 'Correct Answer'
-    
-    # Add the correct answer to the option list
-    options.append(correct_answer)
-
-    # Make a list of other options as distractors
-    wrong_options = []
-    for content in all_content:
-        if content[option_type] != correct_answer:
-            wrong_options.append(content[option_type])
 
-    # Shuffle the order of the wrong options and take the last three elements as distractors
-    random.shuffle(wrong_options)
-    options.extend(wrong_options[-3:])
+    # Mix the correct answer in with three random distractors
+    options, correct_index = build_options(correct_answer, pool)
 
-    # Shuffle the order of the four options
-    random.shuffle(options)
+    return question_prompt, options, correct_index
 
-    return question_prompt, options
 
-
-def get_correct_answer_index(options: List[str], correct_answer: str) -> int:
-    """
-    Gets the index (aka location) of the correct answer.
-
-    Args:
-        options (list[str]): A list of strings representing the options
-        correct_answer (str): A string representing the correct option
-
-    Returns:
-        int: An integer value representing the index of the correct answer. (Must be 0-3)
-    """
-    return options.index(correct_answer)
-
-
-def run_mistake_review(all_content: List[Dict[str, str]], quiz_type: str, mistakes_list: List[MistakeReview]) -> Tuple[int, List[MistakeReview]]:
+def run_mistake_review(pool: Sequence[str], quiz_type: str, mistakes_list: List[MistakeReview]) -> Tuple[int, List[MistakeReview]]:
     """
     Runs a quiz based on the mistakes the user had just made.
     
     Args:
-        all_content (list[dict[str, str]]): A list of dictionaries containing all vocabs / characters.
+        pool (Sequence[str]): The answers of all vocabs / characters to draw distractors from.
         quiz_type (str): A string representing the type of quiz to be displayed.
         mistakes_list: List of dictionaries containing mistake information
     
@@ -123,8 +207,10 @@ def run_mistake_review(all_content: List[Dict[str, str]], quiz_type: str, mistak
     random.shuffle(mistakes_list)
     
     cleared_mistakes = 0
-    remaining_mistakes = []
     user_quit_early = False
+
+    # Flags for which mistakes were cleared. The remaining ones are collected once at the end.
+    cleared = bytearray(len(mistakes_list))
     
     q_no = 0
     while q_no < len(mistakes_list):
@@ -134,76 +220,42 @@ def run_mistake_review(all_content: List[Dict[str, str]], quiz_type: str, mistak
         if quiz_type == 'jlpt':
             question_prompt = mistake['word']
             correct_answer = mistake['correct_answer']
-            option_type = 'Meaning'
         elif quiz_type == 'character':
             question_prompt = mistake['word']
             correct_answer = mistake['Correct Answer']
-            option_type = 'Correct Answer'
 
-        options = [correct_answer]
+        # Mix the correct answer in with three random distractors
+        options, correct_index = build_options(correct_answer, pool)
         
-        # Make a list of other options as distractors
-        wrong_options = []
-        for content in all_content:
-            if content[option_type] != correct_answer:
-                wrong_options.append(content[option_type])
+        kana_text = f" ({mistake['kana']})" if mistake['kana'] != question_prompt else ''
+        outcome, choice_index = ask_question(f'Review Q{q_no + 1}. Choose the meaning for:', question_prompt, options,
+                                             correct_index, UI.CONTINUE_REVIEW_MSG, kana_text)
         
-        # Shuffle the order of the wrong options and take the last three elements as distractors
-        random.shuffle(wrong_options)
-        options.extend(wrong_options[-3:])
-        
-        # Shuffle the order of the four options
-        random.shuffle(options)
-        
-        # Print out the question
-        print(f'{UI.Colours.BOLD}Review Q{q_no + 1}. Choose the meaning for:{UI.Colours.END}')
-        print(f'{UI.Colours.BOLD}{UI.Colours.PURPLE}{question_prompt}{UI.Colours.END}' + 
-              (f' ({mistake['kana']})' if mistake['kana'] != question_prompt else ''))
-        
-        # Print out the options
-        for n, option in enumerate(options):
-            option_letter = chr(65 + n)
-            print(f'{UI.Colours.BOLD}{option_letter}{UI.Colours.END} | {option}')
-        
-        print()
-        
-        # Getting the user's choice
-        user_choice = UI.get_user_choice('Answer | ', ['A', 'B', 'C', 'D', 'Q'])
-        
-        # The user chooses to quit
-        if user_choice == 'Q':
-            # Confirmation
-            user_confirmation = UI.get_user_choice(f'{UI.Colours.YELLOW}Are you sure? You will lose all your current progress! [{UI.Colours.BOLD}Y/N{UI.Colours.END}{UI.Colours.YELLOW}] | {UI.Colours.END}', ['Y', 'N'])
-            # Confirmed
-            if user_confirmation == 'Y':
-                # Add all remaining mistakes including the current one
-                remaining_mistakes.extend(mistakes_list[q_no:])
-                user_quit_early = True
-                return cleared_mistakes, remaining_mistakes, user_quit_early
-            # Cancelled
-            elif user_confirmation == 'N':
-                print(f'{UI.Colours.GREEN}Continuing review...{UI.Colours.END}\n')
-                continue
-        
-        # Getting the indices of chosen option and correct option
-        choice_index = ord(user_choice) - ord('A')
-        correct_index = get_correct_answer_index(options, correct_answer)
+        # The user chose to quit
+        if outcome == 'quit':
+            # Keep all uncleared mistakes including the current one
+            remaining_mistakes = [mistake for n, mistake in enumerate(mistakes_list) if not cleared[n]]
+            user_quit_early = True
+            return cleared_mistakes, remaining_mistakes, user_quit_early
+        elif outcome == 'continue':
+            continue
         
         # Checking if the answer is correct
-        if choice_index == correct_index:
-            print(f'{UI.Colours.GREEN}Correct! This word will be removed from your mistakes.{UI.Colours.END}\n')
+        if outcome == 'correct':
+            print(UI.MISTAKE_CLEARED_MSG, end='\n\n')
             cleared_mistakes += 1
+            cleared[q_no] = 1
         else:
-            print(f'{UI.Colours.RED}Still incorrect.{UI.Colours.END}')
+            print(UI.STILL_INCORRECT_MSG)
             print(f'{UI.Colours.YELLOW}Correct Answer: {chr(65 + correct_index)} | {correct_answer}.{UI.Colours.END}\n')
-            # Keep this mistake in the list
-            remaining_mistakes.append(mistake)
 
         q_no += 1
     
     # Show summary of review
     print(f"\n{UI.Colours.BOLD}Review Summary{UI.Colours.END}")
     print(f"You cleared {UI.Colours.GREEN}{cleared_mistakes}{UI.Colours.END}/{len(mistakes_list)} mistakes from your list.")
+
+    remaining_mistakes = [mistake for n, mistake in enumerate(mistakes_list) if not cleared[n]]
     
     return cleared_mistakes, remaining_mistakes, False
 
@@ -221,32 +273,26 @@ def run_mistake_practice():
         input(f"\nPress Enter to return to the Main Menu... | ")
         return
     
-    # Load JLPT vocab for generating quiz options
-    all_jlpt_vocab = []
-    for level in ['N5', 'N4', 'N3', 'N2', 'N1']:
-        all_jlpt_vocab.extend(DATA.load_jlpt_vocab(level))
+    # Draw distractors from the meanings of every JLPT level. Each pool is cached by the data loader.
+    all_meanings = tuple(chain.from_iterable(DATA.load_meaning_pool(level) for level in DATA.JLPT_FILES))
     
     # Review mistakes
-    corrected_mistake_num, remaining_mistakes, user_quit_early = QUIZ.run_mistake_review(all_jlpt_vocab, 'jlpt', all_mistakes)
+    corrected_mistake_num, remaining_mistakes, user_quit_early = run_mistake_review(all_meanings, 'jlpt', all_mistakes)
     
     # If the user quit mid way, ignore any changes and do not modify the mistake database
     if user_quit_early:
         print(f'\n{UI.Colours.YELLOW}Quitting review. Mistakes made in previous quiz will still be saved.')
 
     else:
-        MISTAKE.reset_mistakes()
-
-        for mistake in remaining_mistakes:
-            MISTAKE.add_mistake(
-                mistake['word'],
-                mistake['kana'],
-                mistake['correct_answer'],
-                mistake['user_answer']
-            )
+        # Swap in the remaining mistakes with one write
+        MISTAKE.replace_mistakes(remaining_mistakes)
             
         print(f"\n{UI.Colours.GREEN}You cleared {corrected_mistake_num} out of {len(all_mistakes)} mistakes!{UI.Colours.END}")
         print(f"{UI.Colours.YELLOW}{len(remaining_mistakes)} mistakes remain in your practice list.{UI.Colours.END}")
     
+    # Save before waiting on the user, since atexit does not run if the terminal is closed
+    MISTAKE.flush_mistakes()
+
     input(f"\nPress Enter to return to the Main Menu... | ")
 
 
@@ -260,8 +306,11 @@ def run_jlpt_quiz(level: str):
     # Load all vocabs in this JLPT level into a list
     all_vocabs = DATA.load_jlpt_vocab(level)
 
-    # Choose 10 random vocbularies
-    quiz_content = random.sample(all_vocabs, 10)
+    # Choose 10 random vocbularies (or all of them if the level has fewer)
+    quiz_content = random.sample(all_vocabs, min(10, len(all_vocabs)))
+
+    # Draw distractors from every meaning in this level
+    meaning_pool = DATA.load_meaning_pool(level)
 
     print(f'\n{UI.Colours.BLUE}You have chosen {UI.Colours.BOLD}{level}{UI.Colours.END}!\n')
     UI.display_quiz_tips()
@@ -272,48 +321,28 @@ def run_jlpt_quiz(level: str):
     q_no = 0
     while q_no < len(quiz_content):
         content = quiz_content[q_no]
-        question_prompt, options = generate_question(content, quiz_content, 'jlpt')
-
-        # Print out the question
-        print(f'{UI.Colours.BOLD}Q{q_no + 1}. Choose the meaning most suited for the following vocabulary.{UI.Colours.END}')
-        print(f'{UI.Colours.BOLD}{UI.Colours.PURPLE}{question_prompt}{UI.Colours.END}')
-
-        # Print out the options
-        for n, option in enumerate(options):
-            option_no = chr(65 + n)
-            print(f'{UI.Colours.BOLD}{option_no}{UI.Colours.END} | {option}')
-
-        print()
-
-        # Getting the user's choice
-        user_choice = UI.get_user_choice('Answer | ', ['A', 'B', 'C', 'D', 'Q'])
-
-        # The user chooses to quit
-        if user_choice == 'Q':
-            # Confirmation
-            user_confirmation = UI.get_user_choice(f'{UI.Colours.YELLOW}Are you sure? You will lose all your current progress! [{UI.Colours.BOLD}Y/N{UI.Colours.END}{UI.Colours.YELLOW}] | {UI.Colours.END}', ['Y', 'N'])
-            # Confirmed
-            if user_confirmation == 'Y':
-                print(f'{UI.Colours.RED}Quiz terminated. No progress saved.{UI.Colours.END}\n')
-                return
-            # Cancelled
-            elif user_confirmation == 'N':
-                print(f'{UI.Colours.GREEN}Continuing quiz...{UI.Colours.END}\n')
-                continue
-
-        # Getting the indices of chosen option and correct option
-        choice_index = ord(user_choice) - ord('A')
-        correct_index = get_correct_answer_index(options, content['Meaning'])
+        question_prompt, options, correct_index = generate_question(content, 'jlpt', meaning_pool)
+
+        outcome, choice_index = ask_question(f'Q{q_no + 1}. Choose the meaning most suited for the following vocabulary.',
+                                             question_prompt, options, correct_index, UI.CONTINUE_QUIZ_MSG)
+
+        # The user chose to quit
+        if outcome == 'quit':
+            print(UI.QUIZ_TERMINATED_MSG, end='\n\n')
+            PROGRESS.flush_progress()
+            return
+        elif outcome == 'continue':
+            continue
 
         # Checking if the answer is right. Increment score if so.
-        if choice_index == correct_index:
-            print(f'{UI.Colours.GREEN}Correct.{UI.Colours.END}\n')
+        if outcome == 'correct':
+            print(UI.CORRECT_MSG, end='\n\n')
             score += 1
 
             kanji = content['Kanji']
             PROGRESS.add_mastered_vocab(level, kanji)
         else:
-            print(f'{UI.Colours.RED}Wrong.{UI.Colours.END}')
+            print(UI.WRONG_MSG)
             print(f'{UI.Colours.YELLOW}Correct Answer: {chr(65 + correct_index)} | {content['Meaning']}.{UI.Colours.END}\n')
 
             # Save this question into the mistake list
@@ -326,6 +355,9 @@ def run_jlpt_quiz(level: str):
 
         q_no += 1
 
+    # Save the mastered vocabs before any further prompts
+    PROGRESS.flush_progress()
+
     # Present Quiz Summary
     print(f'Quiz Summary')
     print(f'You got {UI.Colours.GREEN}{score}{UI.Colours.END}/{len(quiz_content)} correct.\n')
@@ -340,7 +372,7 @@ def run_jlpt_quiz(level: str):
 
         if review_choice == 'Y':
             # Getting the number of corrected mistakes and the updated mistake list
-            corrected_mistake_no, updated_mistakes, user_quit_early = run_mistake_review(all_vocabs, 'jlpt', mistakes)
+            corrected_mistake_no, updated_mistakes, user_quit_early = run_mistake_review(meaning_pool, 'jlpt', mistakes)
 
             # If the user quit mid way, ignore any changes and do not modify the mistake database
             if user_quit_early:
@@ -382,6 +414,9 @@ def run_jlpt_quiz(level: str):
                     mistake['user_answer']
                 )
 
+    # Save before waiting on the user, since atexit does not run if the terminal is closed
+    MISTAKE.flush_mistakes()
+
     input(f'Press Enter to return to the Main Menu... | ')
 
 
@@ -392,8 +427,11 @@ def run_character_quiz():
     # Load all characters into a list
     all_characters = DATA.load_characters()
 
-    # Choose 10 random characters
-    quiz_content = random.sample(all_characters, 10)
+    # Choose 10 random characters (or all of them if there are fewer)
+    quiz_content = random.sample(all_characters, min(10, len(all_characters)))
+
+    # Draw distractors from every character reading
+    character_pool = DATA.load_character_pool()
 
     print(f'\n{UI.Colours.BLUE}You have chosen {UI.Colours.BOLD}Character Quiz{UI.Colours.END}!\n')
     UI.display_quiz_tips()
@@ -403,45 +441,24 @@ def run_character_quiz():
     q_no = 0
     while q_no < len(quiz_content):
         content = quiz_content[q_no]
-        question_prompt, options = generate_question(content, quiz_content, 'character')
-
-        # Print out the question
-        print(f'{UI.Colours.BOLD}Q{q_no + 1}. Choose the reading most suited for the following character.{UI.Colours.END}')
-        print(f'{UI.Colours.BOLD}{UI.Colours.PURPLE}{question_prompt}{UI.Colours.END}')
-
-        # Print out the options
-        for n, option in enumerate(options):
-            option_no = chr(65 + n)
-            print(f'{UI.Colours.BOLD}{option_no}{UI.Colours.END} | {option}')
-
-        print()
-
-        # Getting the user's choice
-        user_choice = UI.get_user_choice('Answer | ', ['A', 'B', 'C', 'D', 'Q'])
-
-        # The user chooses to quit
-        if user_choice == 'Q':
-            # Confirmation
-            user_confirmation = UI.get_user_choice(f'{UI.Colours.YELLOW}Are you sure? You will lose all your current progress! [{UI.Colours.BOLD}Y/N{UI.Colours.END}{UI.Colours.YELLOW}] | {UI.Colours.END}', ['Y', 'N'])
-            # Confirmed
-            if user_confirmation == 'Y':
-                print(f'{UI.Colours.RED}Quiz terminated. No progress saved.{UI.Colours.END}')
-                return
-            # Cancelled
-            elif user_confirmation == 'N':
-                print(f'{UI.Colours.GREEN}Continuing quiz...{UI.Colours.END}\n')
-                continue
-
-        # Getting the indices of chosen option and correct option
-        choice_index = ord(user_choice) - ord('A')
-        correct_index = get_correct_answer_index(options, content['Correct Answer'])
+        question_prompt, options, correct_index = generate_question(content, 'character', character_pool)
+
+        outcome, choice_index = ask_question(f'Q{q_no + 1}. Choose the reading most suited for the following character.',
+                                             question_prompt, options, correct_index, UI.CONTINUE_QUIZ_MSG)
+
+        # The user chose to quit
+        if outcome == 'quit':
+            print(UI.QUIZ_TERMINATED_MSG)
+            return
+        elif outcome == 'continue':
+            continue
 
         # Checking if the answer is right. Increment score if so.
-        if choice_index == correct_index:
-            print(f'{UI.Colours.GREEN}Correct.{UI.Colours.END}\n')
+        if outcome == 'correct':
+            print(UI.CORRECT_MSG, end='\n\n')
             score += 1
         else:
-            print(f'{UI.Colours.RED}Wrong.{UI.Colours.END}')
+            print(UI.WRONG_MSG)
             print(f'{UI.Colours.YELLOW}Correct Answer: {chr(65 + correct_index)} | {content['Correct Answer']}.{UI.Colours.END}')
         
         # Move to the next question
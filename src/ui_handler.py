@@ -9,11 +9,12 @@ https://docs.python.org/3/tutorial/inputoutput.html
 
 
 import os
+import re
+import sys
 import time
 from typing import List, Dict, TypedDict
 
 import data_loader as DATA
-import ui_handler as UI
 
 
 class Colours:
@@ -28,6 +29,44 @@ class Colours:
     END = '\033[0m'
 
 
+# Frequently printed messages, formatted once at import instead of on every print
+CORRECT_MSG = f'{Colours.GREEN}Correct.{Colours.END}'
+WRONG_MSG = f'{Colours.RED}Wrong.{Colours.END}'
+QUIT_CONFIRM_PROMPT = f'{Colours.YELLOW}Are you sure? You will lose all your current progress! [{Colours.BOLD}Y/N{Colours.END}{Colours.YELLOW}] | {Colours.END}'
+QUIZ_TERMINATED_MSG = f'{Colours.RED}Quiz terminated. No progress saved.{Colours.END}'
+CONTINUE_QUIZ_MSG = f'{Colours.GREEN}Continuing quiz...{Colours.END}'
+CONTINUE_REVIEW_MSG = f'{Colours.GREEN}Continuing review...{Colours.END}'
+MISTAKE_CLEARED_MSG = f'{Colours.GREEN}Correct! This word will be removed from your mistakes.{Colours.END}'
+STILL_INCORRECT_MSG = f'{Colours.RED}Still incorrect.{Colours.END}'
+
+# Templates for the entries in the vocab and character lists
+VOCAB_ENTRY_TEMPLATE = f'{{num:2d}}. {Colours.PURPLE}{{kanji}}{Colours.END}{{kana}} - {Colours.GREEN}{{meaning}}{Colours.END}'
+PLAIN_VOCAB_ENTRY_TEMPLATE = '{num:2d}. {kanji}{kana} - {meaning}'
+CHARACTER_ENTRY_TEMPLATE = f'{{num:2d}}. {Colours.PURPLE}{{character}}{Colours.END} - {Colours.GREEN}{{reading}}{Colours.END}'
+PLAIN_CHARACTER_ENTRY_TEMPLATE = '{num:2d}. {character} - {reading}'
+
+# Static parts of the menus, with placeholders for the values that change between displays
+MAIN_MENU_TEMPLATE = (f'\n{Colours.CYAN}Please choose what you want to do today!{Colours.END}\n\n'
+                      f'1. {Colours.BOLD}JLPT Quiz{Colours.END}\n'
+                      f'2. {Colours.BOLD}Character Quiz{Colours.END}\n'
+                      f'3. {Colours.BOLD}Learn the Vocabs{Colours.END}\n'
+                      f'4. {Colours.BOLD}Learn the Characters{Colours.END}\n'
+                      f'5. {Colours.BOLD}Mistake Practice{Colours.END} [{Colours.YELLOW}{{mistake_count}} {{mistake_word}} right now!{Colours.END}]\n'
+                      f'6. {Colours.BOLD}Reset{Colours.END}\n'
+                      f'7. {Colours.BOLD}Quit{Colours.END}\n')
+JLPT_QUIZ_MENU_TEMPLATE = (f'\n{Colours.BLUE}{Colours.BOLD}JLPT Quiz{Colours.END}\n'
+                           f'{Colours.CYAN}Please choose your proficiency level!{Colours.END}\n\n'
+                           f'1. {Colours.BOLD}N5{Colours.END} [{Colours.GREEN}{{N5[0]}}{Colours.END}/{{N5[1]}} mastered!]\n'
+                           f'2. {Colours.BOLD}N4{Colours.END} [{Colours.GREEN}{{N4[0]}}{Colours.END}/{{N4[1]}} mastered!]\n'
+                           f'3. {Colours.BOLD}N3{Colours.END} [{Colours.GREEN}{{N3[0]}}{Colours.END}/{{N3[1]}} mastered!]\n'
+                           f'4. {Colours.BOLD}N2{Colours.END} [{Colours.GREEN}{{N2[0]}}{Colours.END}/{{N2[1]}} mastered!]\n'
+                           f'5. {Colours.BOLD}N1{Colours.END} [{Colours.GREEN}{{N1[0]}}{Colours.END}/{{N1[1]}} mastered!]\n'
+                           f"...or enter 'r' to return to the previous menu!\n")
+
+# Kana and CJK ideographs take up two columns in the terminal
+WIDE_CHARACTERS = re.compile('[\u3040-\u30ff\u4e00-\u9fff]')
+
+
 class Options(TypedDict):
     A: str
     B: str
@@ -46,20 +85,33 @@ def get_user_choice(prompt: str, valid_options: list[str]) -> str:
     Returns:
         str: The user's valid choice as a string.
     """
-    while True:
-        choice = input(prompt).strip()
+    # Uppercase all options once so input can be matched case-insensitively
+    valid = frozenset(str(option).upper() for option in valid_options)
 
+    while True:
         # Uppercase all user input to make it more user friendly
-        choice = choice.upper()
-        valid_options = [str(option).upper() for option in valid_options]
+        choice = input(prompt).strip().upper()
 
         # Return a string value if input is valid
-        if choice in valid_options:
+        if choice in valid:
             return choice
         
         print(f'{Colours.RED}Invalid choice. Please try again.{Colours.END}')
 
 
+def visual_width(text: str) -> int:
+    """
+    Gets the number of terminal columns a string takes up.
+
+    Args:
+        text (str): The string without any colour codes.
+
+    Returns:
+        int: The display width, counting Kana and Kanji as two columns each.
+    """
+    return len(text) + len(WIDE_CHARACTERS.findall(text))
+
+
 def display_title(title: str):
     """
     Displays the title in a fixed format.
@@ -87,18 +139,8 @@ def display_main_menu(mistake_count: int) -> int:
     Returns:
         int: The user's choice of action in the main menu as an integer (1-5).
     """
-    print(f'\n{UI.Colours.CYAN}Please choose what you want to do today!{UI.Colours.END}\n')
-    print(f'1. {Colours.BOLD}JLPT Quiz{Colours.END}')
-    print(f'2. {Colours.BOLD}Character Quiz{Colours.END}')
-    print(f'3. {Colours.BOLD}Learn the Vocabs{Colours.END}')
-    print(f'4. {Colours.BOLD}Learn the Characters{Colours.END}')
-    if mistake_count == 1:
-        print(f'5. {Colours.BOLD}Mistake Practice{Colours.END} [{Colours.YELLOW}{mistake_count} mistake right now!{Colours.END}]')
-    else:
-        print(f'5. {Colours.BOLD}Mistake Practice{Colours.END} [{Colours.YELLOW}{mistake_count} mistakes right now!{Colours.END}]')
-    print(f'6. {Colours.BOLD}Reset{Colours.END}')
-    print(f'7. {Colours.BOLD}Quit{Colours.END}')
-    print()
+    mistake_word = 'mistake' if mistake_count == 1 else 'mistakes'
+    print(MAIN_MENU_TEMPLATE.format(mistake_count=mistake_count, mistake_word=mistake_word))
     return get_user_choice('Choice | ', range(1, 8))
 
 
@@ -112,17 +154,7 @@ def display_jlpt_quiz_menu(progress: Dict[str, tuple[int, int]]) -> int:
     Returns:
         int: The user's choice of action in the main menu as an integer (1-5).
     """
-    score = progress['N5'][0]
-
-    print(f'\n{Colours.BLUE}{Colours.BOLD}JLPT Quiz{Colours.END}')
-    print(f'{Colours.CYAN}Please choose your proficiency level!{Colours.END}\n')
-    print(f'1. {Colours.BOLD}N5{Colours.END} [{Colours.GREEN}{progress['N5'][0]}{Colours.END}/{progress['N5'][1]} mastered!]')
-    print(f'2. {Colours.BOLD}N4{Colours.END} [{Colours.GREEN}{progress['N4'][0]}{Colours.END}/{progress['N4'][1]} mastered!]')
-    print(f'3. {Colours.BOLD}N3{Colours.END} [{Colours.GREEN}{progress['N3'][0]}{Colours.END}/{progress['N3'][1]} mastered!]')
-    print(f'4. {Colours.BOLD}N2{Colours.END} [{Colours.GREEN}{progress['N2'][0]}{Colours.END}/{progress['N2'][1]} mastered!]')
-    print(f'5. {Colours.BOLD}N1{Colours.END} [{Colours.GREEN}{progress['N1'][0]}{Colours.END}/{progress['N1'][1]} mastered!]')
-    print(f"...or enter 'r' to return to the previous menu!")
-    print()
+    print(JLPT_QUIZ_MENU_TEMPLATE.format_map(progress))
     return get_user_choice('Choice | ', ['1', '2', '3', '4', '5', 'R'])
 
 
@@ -179,46 +211,47 @@ def display_vocabulary(level: str):
     vocabulary = DATA.load_jlpt_vocab(level)
 
     if not vocabulary:
-        print(f"{UI.Colours.RED}No vocabulary data found for {level}!{UI.Colours.END}")
+        print(f"{Colours.RED}No vocabulary data found for {level}!{Colours.END}")
         return
     
-    print(f"\n{UI.Colours.BLUE}{UI.Colours.BOLD}Learn JLPT {level} Vocabulary{UI.Colours.END}")
-    print(f"{UI.Colours.CYAN}Here are all the {level} vocabularies and their pronunciations:{UI.Colours.END}\n")
+    print(f"\n{Colours.BLUE}{Colours.BOLD}Learn JLPT {level} Vocabulary{Colours.END}")
+    print(f"{Colours.CYAN}Here are all the {level} vocabularies and their pronunciations:{Colours.END}\n")
 
     num_columns = 2
     vocab_per_column = (len(vocabulary) + num_columns - 1) // num_columns
 
     column_width = 55
 
+    # Bind the formatters used inside the loop to locals to skip repeated global lookups
+    format_entry = VOCAB_ENTRY_TEMPLATE.format
+    format_plain_entry = PLAIN_VOCAB_ENTRY_TEMPLATE.format
+    width_of = visual_width
+
+    lines = []
     for line in range(vocab_per_column):
-        line_output = ''
+        cells = []
         for col in range(num_columns):
             index = line + col * vocab_per_column
             if index < len(vocabulary):
                 vocab = vocabulary[index]
                 item_num = index + 1
                 
-                vocab_text = f'{item_num:2d}. {Colours.PURPLE}{vocab['Kanji']}{Colours.END}'
+                kana_text = ''
                 if 'Kana' in vocab and vocab['Kana']:
-                    vocab_text += f' ({vocab['Kana']})'
-                vocab_text += f' - {Colours.GREEN}{vocab['Meaning']}{Colours.END}'
+                    kana_text = f" ({vocab['Kana']})"
 
-                plain_text = f"{item_num:2d}. {vocab['Kanji']}"
-                if 'Kana' in vocab and vocab['Kana']:
-                    plain_text += f" ({vocab['Kana']})"
-                plain_text += f" - {vocab['Meaning']}"
-
-                visible_width = 0
-                for char in plain_text:
-                    if '\u4e00' <= char <= '\u9fff' or '\u3040' <= char <= '\u30ff':
-                        visible_width += 2 
-                    else:
-                        visible_width += 1
+                vocab_text = format_entry(num=item_num, kanji=vocab['Kanji'], kana=kana_text, meaning=vocab['Meaning'])
+                plain_text = format_plain_entry(num=item_num, kanji=vocab['Kanji'], kana=kana_text, meaning=vocab['Meaning'])
 
+                visible_width = width_of(plain_text)
                 padding = max(2, column_width - visible_width)
 
-                line_output += vocab_text + " " * padding
-        print(line_output)
+                cells.append(vocab_text)
+                cells.append(' ' * padding)
+        cells.append('\n')
+        lines.append(''.join(cells))
+
+    sys.stdout.writelines(lines)
 
     input(f'\nPress Enter to return to the Main Menu... | ')
 
@@ -230,30 +263,39 @@ def display_characters():
     all_characters = DATA.load_characters()
     
     if not all_characters:
-        print(f"{UI.Colours.RED}No character data found!{UI.Colours.END}")
+        print(f"{Colours.RED}No character data found!{Colours.END}")
         return
     
-    print(f"\n{UI.Colours.BOLD}{UI.Colours.BLUE}Learn the Characters{UI.Colours.END}")
-    print(f"{UI.Colours.CYAN}Here are all the available characters and their pronunciations:{UI.Colours.END}\n")
+    print(f"\n{Colours.BOLD}{Colours.BLUE}Learn the Characters{Colours.END}")
+    print(f"{Colours.CYAN}Here are all the available characters and their pronunciations:{Colours.END}\n")
     
     num_columns = 4
     char_per_column = (len(all_characters) + num_columns - 1) // num_columns
     column_width = 25
 
+    # Bind the formatters used inside the loop to locals to skip repeated global lookups
+    format_entry = CHARACTER_ENTRY_TEMPLATE.format
+    format_plain_entry = PLAIN_CHARACTER_ENTRY_TEMPLATE.format
+
+    lines = []
     for line in range(char_per_column):
-        line_output = ''
+        cells = []
         for col in range(num_columns):
             index = line + col * char_per_column
             if index < len(all_characters):
                 char = all_characters[index]
                 item_num = index + 1
-                char_display = f'{item_num:2d}. {Colours.PURPLE}{char['Character']}{Colours.END} - {Colours.GREEN}{char['Correct Answer']}{Colours.END}'
+                char_display = format_entry(num=item_num, character=char['Character'], reading=char['Correct Answer'])
 
-                visible_length = len(f"{item_num:2d}. {char['Character']} - {char['Correct Answer']}")
+                visible_length = len(format_plain_entry(num=item_num, character=char['Character'], reading=char['Correct Answer']))
                 padding = column_width - visible_length
 
-                line_output += char_display + ' ' * padding
-        print(line_output)
+                cells.append(char_display)
+                cells.append(' ' * padding)
+        cells.append('\n')
+        lines.append(''.join(cells))
+
+    sys.stdout.writelines(lines)
     
     input(f"\nPress Enter to return to the Main Menu... | ")
     print()
\ No newline at end of file